@@ -24,11 +24,7 @@ Best practices for setup.py and requirements.txt
 https://caremad.io/posts/2013/07/setup-vs-requirement/
 """
 
-from glob import glob
-from os.path import basename
-from os.path import splitext
-
-from setuptools import find_packages, setup
+from setuptools import setup
 
 setup(
     name='sally',
@@ -39,9 +35,14 @@ setup(
     author='Philip S. Feairheller, Kent Bull, Benjamin Keller',
     author_email='pfeairheller@gmail.com, kent@kentbull.com',
     url='https://github.com/kentbull/sally',
-    packages=find_packages('src'),
+    packages=['sally',
+              'sally.app',
+              'sally.app.cli',
+              'sally.app.cli.commands',
+              'sally.app.cli.commands.hook',
+              'sally.app.cli.commands.server',
+              'sally.core'],
     package_dir={'': 'src'},
-    py_modules=[splitext(basename(path))[0] for path in glob('src/*.py')],
     include_package_data=True,
     zip_safe=False,
     classifiers=[
@@ -76,7 +77,8 @@ setup(
         'multicommand>=1.0.0',
         'blake3>=0.3.1',
         'falcon>=3.1.0',
-        'http_sfv>=0.9.8'
+        'http_sfv>=0.9.8',
+        'orjson>=3.8.3'
     ],
     extras_require={
     },
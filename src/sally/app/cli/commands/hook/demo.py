@@ -53,18 +53,19 @@ class Listener:
         """
         print('Cop | received request')
         body = req.get_media()
-        match body['action']:
-            case 'iss':
-                print(f"Cop | Valid Credential. Validated at {datetime.datetime.now()}")
-                self.debug_request(req, body)
-            case 'rev':
-                schemaSaid = body['data']['schema']
-                credentialSaid = body['data']['credential']
-                revocationTimestamp = body['data']['revocationTimestamp']
-                print(f"Cop | Invalid credential {credentialSaid} with schema {schemaSaid}. Revoked on: {revocationTimestamp}")
-                self.debug_request(req, body)
-            case _:
-                print('Unexpected action type')
+        for event in body['events']:  # each delivery is a batch of events
+            match event['action']:
+                case 'iss':
+                    print(f"Cop | Valid Credential. Validated at {datetime.datetime.now()}")
+                    self.debug_request(req, event)
+                case 'rev':
+                    schemaSaid = event['data']['schema']
+                    credentialSaid = event['data']['credential']
+                    revocationTimestamp = event['data']['revocationTimestamp']
+                    print(f"Cop | Invalid credential {credentialSaid} with schema {schemaSaid}. Revoked on: {revocationTimestamp}")
+                    self.debug_request(req, event)
+                case _:
+                    print('Unexpected action type')
 
     def debug_request(self, req, body):
         print("*** HEADERS **")
@@ -66,3 +66,23 @@ class CueBaser(dbing.LMDBer):
         self.ack = proving.CrederSuber(db=self, subkey='ack')
 
         return self.env
+
+    def write(self, ops):
+        """ Apply a batch of sub db operations in a single write transaction
+
+        Each op is a (suber, keys, val) triple applied in order.  A None val
+        deletes the entry, otherwise val is pinned (set, overwriting).  Grouping
+        related writes this way pays one LMDB commit instead of one per call.
+
+        Parameters:
+            ops (list): of (suber, keys, val) triples against sub dbs of this env
+
+        """
+        with self.env.begin(write=True) as txn:
+            for (suber, keys, val) in ops:
+                key = suber._tokey(keys)
+                if val is None:
+                    txn.delete(key, db=suber.sdb)
+                else:
+                    ser = val.raw if isinstance(val, proving.Creder) else suber._ser(val)
+                    txn.put(key, ser, db=suber.sdb, overwrite=True)
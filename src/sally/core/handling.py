@@ -5,12 +5,16 @@ sally.core.handling module
 
 EXN Message handling
 """
-import datetime
-import json
+import functools
+import logging
+import heapq
+import random
+import sys
 from base64 import urlsafe_b64encode as encodeB64
-from collections import namedtuple
+from collections import deque, namedtuple
 from urllib import parse
 
+import orjson
 from hio.base import doing
 from hio.core import http
 from hio.help import decking, Hict
@@ -22,22 +26,37 @@ from keri.help import helping
 from sally.core import httping
 
 logger = help.ogler.getLogger()
-QVI_SCHEMA = "EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao"
-LE_SCHEMA = "ENPXp1vQzRF6JwIuS-mp2U8Uf1MoADoP_GqQ62VsDZWY"
-OOR_AUTH_SCHEMA = "EKA57bKBKxr_kN7iN5i7lMUxpMG-s19dRcmov1iDxz-E"
-OOR_SCHEMA = "EBNaNu-M9P5cgrnfl2Fvymy4E_jvxxyjb70PRtiANlJy"
-IDCARD_SCHEMA = "EEYMNgyQNHWrsO4m65Px84M93o2url6aUpTFqNdMZdKt"
+# schema SAIDs are interned so comparisons against a schema coming off the wire,
+# interned again at the point of use, short-circuit on identity instead of
+# walking all 44 characters
+QVI_SCHEMA = sys.intern("EBfdlu8R27Fbx-ehrqwImnK-8Cm79sqbAQ4MmvEAYqao")
+LE_SCHEMA = sys.intern("ENPXp1vQzRF6JwIuS-mp2U8Uf1MoADoP_GqQ62VsDZWY")
+OOR_AUTH_SCHEMA = sys.intern("EKA57bKBKxr_kN7iN5i7lMUxpMG-s19dRcmov1iDxz-E")
+OOR_SCHEMA = sys.intern("EBNaNu-M9P5cgrnfl2Fvymy4E_jvxxyjb70PRtiANlJy")
+IDCARD_SCHEMA = sys.intern("EEYMNgyQNHWrsO4m65Px84M93o2url6aUpTFqNdMZdKt")
 
 
-def loadHandlers(cdb, exc):
+@functools.lru_cache(maxsize=8192)
+def cachedPrefixer(qb64):
+    """ Return a Prefixer for qb64, cached since prefixers are immutable
+
+    Parameters:
+        qb64 (str): qb64 qualified identifier prefix
+
+    """
+    return coring.Prefixer(qb64=qb64)
+
+
+def loadHandlers(cdb, exc, comms=None):
     """ Load handlers for the peer-to-peer challenge response protocol
 
     Parameters:
         cdb (CueBaser): communication escrow database environment
         exc (Exchanger): Peer-to-peer message router
+        comms (Communicator): communicator to wake when new presentations are escrowed
 
     """
-    proofs = PresentationProofHandler(cdb=cdb)
+    proofs = PresentationProofHandler(cdb=cdb, comms=comms)
     exc.addHandler(proofs)
 
 
@@ -50,18 +69,22 @@ class PresentationProofHandler(doing.Doer):
 
     resource = "/presentation"
 
-    def __init__(self, cdb, cues=None, **kwa):
+    def __init__(self, cdb, cues=None, comms=None, **kwa):
         """ Initialize instance
 
         Parameters:
             cdb (CueBaser): communication escrow database environment
             cue(Deck): outbound cues
+            comms (Communicator): communicator to wake when new presentations are escrowed
             **kwa (dict): keyword arguments passes to super Doer
 
         """
-        self.msgs = decking.Deck()
+        # plain deque since only the Exchanger appends and only this Doer pops,
+        # skipping Deck's extra bookkeeping on the hot receive path
+        self.msgs = deque()
         self.cues = cues if cues is not None else decking.Deck()
         self.cdb = cdb
+        self.comms = comms
 
         super(PresentationProofHandler, self).__init__()
 
@@ -84,28 +107,37 @@ class PresentationProofHandler(doing.Doer):
         yield self.tock
 
         while True:
-            while self.msgs:
-                msg = self.msgs.popleft()
-                payload = msg["payload"]
-                # TODO: limit presentations from issuee or issuer from flag.
+            if self.msgs:
+                now = coring.Dater()  # one timestamp per tick is close enough for timeout policy
+                while self.msgs:
+                    msg = self.msgs.popleft()
+                    payload = msg["payload"]
+                    # TODO: limit presentations from issuee or issuer from flag.
 
-                sender = payload["i"]
-                said = payload["a"] if "a" in payload else payload["n"]
+                    sender = payload["i"]
+                    said = payload["a"] if "a" in payload else payload["n"]
 
-                prefixer = coring.Prefixer(qb64=sender)
-                saider = coring.Saider(qb64=said)
-                now = coring.Dater()
+                    # said is already qb64 so pin it directly without a Saider round trip
+                    self.cdb.snd.pin(keys=(said,), val=cachedPrefixer(sender))
+                    self.cdb.iss.pin(keys=(said,), val=now)
 
-                self.cdb.snd.pin(keys=(saider.qb64,), val=prefixer)
-                self.cdb.iss.pin(keys=(saider.qb64,), val=now)
+                    if self.comms is not None:
+                        self.comms.wakeup()
 
-                yield self.tock
+                    yield self.tock
+                    now = coring.Dater()  # refresh each tick so pins never go stale under sustained load
 
             yield self.tock
 
 
 IDCARD_TYPE = 'IdCard'
 
+# schema SAID -> (validator, payload builder) Communicator method names, so supporting
+# a new schema is one entry here instead of another branch in two escrow loops
+VALIDATORS = {
+    IDCARD_SCHEMA: ("validateIdCard", "idCardPayload"),
+}
+
 
 class Communicator(doing.DoDoer):
     """
@@ -116,7 +148,20 @@ class Communicator(doing.DoDoer):
 
     """
 
-    def __init__(self, hby, hab, cdb, reger, auth, hook, timeout=10, retry=3.0):
+    PoolSize = 4  # number of persistent hook connections to spread deliveries across
+    BackoffCap = 60.0  # max delay (in seconds) between retries of a failing hook delivery
+    BackoffJitter = 0.5  # max random spread (in seconds) added to each backoff delay
+    BatchSize = 8  # max events coalesced into one hook POST
+    BatchWait = 0.25  # max age (in seconds) of a partial batch before it is flushed
+    PayloadCacheSize = 4096  # max built payloads memoized across delivery retries
+    SavedCacheSize = 4096  # max saved credential saids remembered awaiting their presentation
+    SweepInterval = 60.0  # period (in seconds) of the low-frequency escrow timeout sweep
+    WakeTock = 0.1  # granularity (in seconds) for noticing new work between escrow passes
+    SigFields = ("Sally-Resource", "@method", "@path", "Sally-Timestamp")  # covered by the hook signature
+    StaticHeaders = (("Content-Type", "application/json"),  # hook headers that never vary per request
+                     ("Connection", "keep-alive"))
+
+    def __init__(self, hby, hab, cdb, reger, auth, hook, timeout=10, retry=3.0, cues=None):
         """
 
         Create a communicator capable of persistent processing of messages and performing
@@ -131,72 +176,167 @@ class Communicator(doing.DoDoer):
             hook (str): web hook to call in response to presentations and revocations
             timeout (int): escrow timeout (in minutes) for events not delivered to upstream web hook
             retry (float): retry delay (in seconds) for failed web hook attempts
+            cues (Deck): verifier cues announcing each credential as it is saved
 
         """
         self.hby = hby
         self.hab = hab
+        self.keyVerfer = hab.kever.serder.verfers[0]  # current signing key, tracked for rotation
+        self.keyid = encodeB64(self.keyVerfer.raw).decode('utf-8')
         self.cdb = cdb
         self.reger = reger
         self.hook = hook
+        purl = parse.urlparse(hook)  # hook never changes so parse it once
+        self.hookHost = purl.hostname
+        self.hookPort = purl.port
+        self.hookPath = purl.path or "/"
+        self.hookQArgs = parse.parse_qs(purl.query)
         self.auth = auth
         self.timeout = timeout
+        self.timeoutSecs = timeout * 60.0  # timeout as seconds for cheap epoch float compares
         self.retry = retry
-        self.clients = dict()
+        self.cues = cues if cues is not None else decking.Deck()
+        self.saved = dict()  # saids of saved credentials seen before their presentation, insertion ordered
+        self.lastSweep = None  # tyme of the last low-frequency timeout sweep
+        self.lastPoll = None  # tyme of the last full escrow pass
+        self.wake = False  # set by producers when new work is escrowed
+        self.states = dict()  # (regk, said) -> TEL state, memoized for one escrow pass
+        self.hookClients = list()  # round robin pool of (client, doer, sent) triples, sent FIFO of in-flight POSTs
+        self.hookIdx = 0
+        self.backoff = dict()  # said -> (attempts, next retry tyme) for failed hook deliveries
+        self.pending = dict()  # resource -> escrow rows accumulating into the next batched hook POST
+        self.pendingSince = dict()  # resource -> tyme its oldest pending row was queued
+        self.solo = set()  # saids that failed in a batch and must be redelivered alone
+        self.payloads = dict()  # said -> built payload, memoized across delivery retries
+        self.issDues = list()  # min-heap of (timeout deadline, said) for presentation escrows
+        self.issDued = set()  # saids with a deadline already on the presentation heap
+        self.revDues = list()  # min-heap of (timeout deadline, said) for revocation escrows
+        self.revDued = set()  # saids with a deadline already on the revocation heap
 
         super(Communicator, self).__init__(doers=[doing.doify(self.escrowDo)])
 
+    def sweepDues(self, db, dues, dued):
+        """ Cancel escrow rows whose timeout deadline has passed, popping only due rows
+
+        Parameters:
+            db (CesrSuber): escrow subdb of said -> Dater
+            dues (list): min-heap of (deadline, said) for rows in db
+            dued (set): saids with a deadline already on the heap
+
+        """
+        now = helping.nowUTC().timestamp()
+        while dues and dues[0][0] <= now:
+            (_, said) = heapq.heappop(dues)
+            dued.discard(said)
+            dater = db.get(keys=(said,))
+            if dater is None:  # already processed and removed
+                continue
+
+            due = dater.datetime.timestamp() + self.timeoutSecs
+            if due <= now:
+                db.rem(keys=(said,))
+            else:  # row was re-pinned since, track the fresh deadline
+                heapq.heappush(dues, (due, said))
+                dued.add(said)
+
+    def trackDue(self, dues, dued, said, dater):
+        """ Push the timeout deadline for an escrow row onto its sweep heap once
+
+        Parameters:
+            dues (list): min-heap of (deadline, said)
+            dued (set): saids with a deadline already on the heap
+            said (str): qb64 SAID of escrowed credential
+            dater (Dater): date time the row was escrowed
+
+        """
+        if said not in dued:
+            heapq.heappush(dues, (dater.datetime.timestamp() + self.timeoutSecs, said))
+            dued.add(said)
+
     def processPresentations(self):
+        while self.cues:  # event-driven: process each credential as the verifier saves it
+            cue = self.cues.popleft()
+            if cue["kin"] != "saved":
+                continue
+
+            creder = cue["creder"]
+            dater = self.cdb.iss.get(keys=(creder.said,))
+            if dater is not None:
+                self.presented(creder.said, dater, creder)
+            else:  # credential arrived before its presentation, remember it
+                self.saved[creder.said] = True
+                while len(self.saved) > self.SavedCacheSize:  # evict oldest entries
+                    del self.saved[next(iter(self.saved))]
+
+        for said in list(self.saved):  # presentations that trailed their credential
+            dater = self.cdb.iss.get(keys=(said,))
+            if dater is None:
+                continue
+
+            creder = self.reger.creds.get(keys=(said,))
+            if creder is not None:
+                del self.saved[said]
+                self.presented(said, dater, creder)
+
+        # low-frequency sweep cancels timed out presentations and catches any saved
+        # credential whose cue was missed
+        if self.lastSweep is not None and (self.tyme - self.lastSweep) < self.SweepInterval:
+            return
+
+        self.lastSweep = self.tyme
+        self.sweepDues(self.cdb.iss, self.issDues, self.issDued)
 
         for (said,), dater in self.cdb.iss.getItemIter():
-            # cancel presentations that have been around longer than timeout
-            now = helping.nowUTC()
+            self.trackDue(self.issDues, self.issDued, said, dater)
             print(f"looking for credential {said}")
-            if now - dater.datetime > datetime.timedelta(minutes=self.timeout):
-                self.cdb.iss.rem(keys=(said,))
-                continue
 
             if self.reger.saved.get(keys=(said,)) is not None:
                 creder = self.reger.creds.get(keys=(said,))
-                try:
-                    regk = creder.status
-                    state = self.reger.tevers[regk].vcState(creder.said)
-                    if state is None or state.ked['et'] not in (coring.Ilks.iss, coring.Ilks.bis):
-                        raise kering.InvalidCredentialStateError(f"Revoked credential {creder.said} being presented")
-
-                    if creder.schema == IDCARD_SCHEMA:
-                        self.validateIdCard(creder)
-                    else:
-                        raise kering.ValidationError(f"credential {creder.said} is of unsupported schema"
-                                                     f" {creder.schema} from issuer {creder.issuer}")
+                self.presented(said, dater, creder)
+
+    def presented(self, said, dater, creder):
+        """ Validate a presented credential now that it has been saved and queue it for delivery
 
-                except kering.InvalidCredentialStateError as ex:
-                    print(ex)
-                    logger.error(f'Revoked credential {creder.said} from issuer {creder.issuer} being presented.')
-                except kering.ValidationError as ex:
-                    print(ex)
-                    logger.error(f"credential {creder.said} from issuer {creder.issuer} failed validation: {ex}")
-                else:
-                    self.cdb.recv.pin(keys=(said, dater.qb64), val=creder)
-                finally:
-                    self.cdb.iss.rem(keys=(said,))
+        Parameters:
+            said (str): qb64 SAID of presented credential
+            dater (Dater): date time the presentation was escrowed
+            creder (Creder): saved credential
 
+        """
+        try:
+            state = self.vcState(creder)
+            if state is None or state.ked['et'] not in (coring.Ilks.iss, coring.Ilks.bis):
+                raise kering.InvalidCredentialStateError(f"Revoked credential {creder.said} being presented")
+
+            entry = VALIDATORS.get(sys.intern(creder.schema))
+            if entry is None:
+                raise kering.ValidationError(f"credential {creder.said} is of unsupported schema"
+                                             f" {creder.schema} from issuer {creder.issuer}")
+            getattr(self, entry[0])(creder)
+
+        except kering.InvalidCredentialStateError as ex:
+            print(ex)
+            logger.error(f'Revoked credential {creder.said} from issuer {creder.issuer} being presented.')
+        except kering.ValidationError as ex:
+            print(ex)
+            logger.error(f"credential {creder.said} from issuer {creder.issuer} failed validation: {ex}")
+        else:
+            self.cdb.recv.pin(keys=(said, dater.qb64), val=creder)
+        finally:
+            self.cdb.iss.rem(keys=(said,))
 
     def processRevocations(self):
+        # cancel revocations that have been around longer than timeout
+        self.sweepDues(self.cdb.rev, self.revDues, self.revDued)
 
         for (said,), dater in self.cdb.rev.getItemIter():
-
-            # cancel revocations that have been around longer than timeout
-            now = helping.nowUTC()
-            if now - dater.datetime > datetime.timedelta(minutes=self.timeout):
-                self.cdb.rev.rem(keys=(said,))
-                continue
+            self.trackDue(self.revDues, self.revDued, said, dater)
 
             creder = self.reger.creds.get(keys=(said,))
             if creder is None:  # received revocation before credential.  probably an error but let it timeout
                 continue
 
-            regk = creder.status
-            state = self.reger.tevers[regk].vcState(creder.said)
+            state = self.vcState(creder)
             if state is None:  # received revocation before status.  probably an error but let it timeout
                 continue
 
@@ -210,49 +350,139 @@ class Communicator(doing.DoDoer):
     def processReceived(self, db, action):
 
         for (said, dates), creder in db.getItemIter():
-            # if said not in self.clients:
+            if any(said == flight[0]  # already in-flight, wait for response
+                   for (_, _, sent) in self.hookClients for batch in sent for flight in batch):
+                continue
+
+            if any(said == row[0]  # already queued for the next batch
+                   for rows in self.pending.values() for row in rows):
+                continue
+
+            if said in self.backoff and self.backoff[said][1] > self.tyme:  # backing off, not yet due
+                continue
+
             resource = creder.schema
             actor = creder.issuer
-            if action == "iss":  # presentation of issued credential
-                if creder.schema == IDCARD_SCHEMA:
-                    data = self.idCardPayload(creder)
+            data = self.payloads.get((action, said))
+            if data is None:  # only build and serialize once across retries of the same credential
+                if action == "iss":  # presentation of issued credential
+                    entry = VALIDATORS.get(sys.intern(creder.schema))
+                    if entry is None:
+                        raise kering.ValidationError(f"credential {creder.said} is of unsupported schema"
+                                                        f" {creder.schema} from issuer {creder.issuer}")
+                    data = getattr(self, entry[1])(creder)
                     print(f"credential {creder.said} is of schema {creder.schema} from issuer {creder.issuer}")
-                else:
-                    raise kering.ValidationError(f"credential {creder.said} is of unsupported schema"
-                                                    f" {creder.schema} from issuer {creder.issuer}")
-            else:  # revocation of credential
-                data = self.revokePayload(creder)
+                else:  # revocation of credential
+                    data = self.revokePayload(creder)
+
+                self.payloads[(action, said)] = data
+                while len(self.payloads) > self.PayloadCacheSize:  # evict oldest entries
+                    del self.payloads[next(iter(self.payloads))]
+
+            row = (said, dates, creder, db, dict(action=action, actor=actor, data=data))
+            if said in self.solo:  # failed as part of a batch, redeliver by itself
+                self.sendBatch([row])
+            else:  # batch per resource since the whole POST is stamped and signed with one
+                rows = self.pending.setdefault(resource, list())
+                if not rows:
+                    self.pendingSince[resource] = self.tyme
+                rows.append(row)
+                if len(rows) >= self.BatchSize:
+                    self.sendBatch(rows)
+                    del self.pending[resource]
+                    del self.pendingSince[resource]
+
+        # each connection sees its responses come back in FIFO order so retire
+        # in-flight batches per client by matching them up front to back, grouping
+        # the retire writes into one transaction
+        ops = list()
+        for idx, (client, clientDoer, sent) in enumerate(self.hookClients):
+            if client.connector.cutoff:  # hook server closed the connection
+                # hio clients do not reconnect and the response FIFO match is lost once a
+                # request can vanish between transmit and response, so fail out everything
+                # queued on this client into backoff and rebuild it fresh
+                while sent:
+                    self.retireBatch(sent.popleft(), good=False, ops=ops)
+
+                self.remove([clientDoer])
+                client.close()
+                client = http.clienting.Client(hostname=self.hookHost, port=self.hookPort)
+                clientDoer = http.clienting.ClientDoer(client=client)
+                self.extend([clientDoer])
+                self.hookClients[idx] = (client, clientDoer, decking.Deck())
+                continue
 
-            self.request(creder.said, resource, action, actor, data)
-                # continue
+            while client.responses and sent:
+                response = client.responses.popleft()
+                batch = sent.popleft()
+                # an errored response carries no usable status (hio leaves it None)
+                status = response["status"]
+                good = (not response.get("errored")
+                        and isinstance(status, int)
+                        and 200 <= status < 300)
+                self.retireBatch(batch, good, ops)
 
+        if ops:
+            self.cdb.write(ops)
 
-            db.rem(keys=(said, dates))
-            self.cdb.ack.pin(keys=(said,), val=creder)
+    def retireBatch(self, batch, good, ops):
+        """ Retire an in-flight batch once its delivery outcome is known
 
+        On success rows are removed from their escrow and queued for ack.  On
+        failure rows back off exponentially, marked for solo redelivery, unless
+        they have outlived the escrow timeout.  Writes are collected into ops
+        for one grouped transaction.
+
+        Parameters:
+            batch (list): escrow rows of form (said, dates, creder, db, event)
+            good (bool): True means the batch was delivered successfully
+            ops (list): accumulates (suber, keys, val) writes for CueBaser.write
 
+        """
+        for (said, dates, creder, sdb, event) in batch:
+            if good:
+                ops.append((sdb, (said, dates), None))
+                ops.append((self.cdb.ack, (said,), creder))
+                self.backoff.pop(said, None)
+                self.solo.discard(said)
+                self.payloads.pop((event["action"], said), None)
+                continue
 
-            # (client, clientDoer) = self.clients[said]
-            # if client.responses:
-            #     response = client.responses.popleft()
-            #     self.remove([clientDoer])
-            #     client.close()
-            #     del self.clients[said]
+            dater = coring.Dater(qb64=dates)
+            now = helping.nowUTC().timestamp()
+            if now - dater.datetime.timestamp() > self.timeoutSecs:
+                ops.append((sdb, (said, dates), None))
+                self.backoff.pop(said, None)
+                self.solo.discard(said)
+            else:  # exponential backoff with jitter before the next attempt, alone so
+                # a poisonous event can not block the rest of a batch
+                self.solo.add(said)
+                (attempts, _) = self.backoff.get(said, (0, 0.0))
+                attempts += 1
+                delay = min(self.BackoffCap, self.retry * 2 ** attempts)
+                self.backoff[said] = (attempts, self.tyme + delay + random.random() * self.BackoffJitter)
+
+    def sendBatch(self, batch):
+        """ Deliver a batch of escrow rows in a single hook POST and track it in-flight
 
-            #     if 200 <= response["status"] < 300:
-            #         db.rem(keys=(said, dates))
-            #         self.cdb.ack.pin(keys=(said,), val=creder)
-            #     else:
-            #         dater = coring.Dater(qb64=dates)
-            #         now = helping.nowUTC()
-            #         if now - dater.datetime > datetime.timedelta(minutes=self.timeout):
-            #             db.rem(keys=(said, dates))
+        Parameters:
+            batch (list): escrow rows of form (said, dates, creder, db, event)
+
+        """
+        resource = batch[0][2].schema
+        events = [row[4] for row in batch]
+        sent = self.request(resource, events)
+        sent.append(batch)
 
     def processAcks(self):
+        ops = list()
         for (said,), creder in self.cdb.ack.getItemIter():
             # TODO: generate EXN ack message with credential information
             # print(f"ACK for credential {said} will be sent to {creder.issuer}")
-            self.cdb.ack.rem(keys=(said,))
+            ops.append((self.cdb.ack, (said,), None))
+
+        if ops:  # retire the whole pass in one write transaction
+            self.cdb.write(ops)
 
     def escrowDo(self, tymth, tock=1.0):
         """ Process escrows of comms pipeline
@@ -277,66 +507,111 @@ class Communicator(doing.DoDoer):
         _ = (yield self.tock)
 
         while True:
-            try:
-                self.processEscrows()
-            except Exception as e:
-                print(e)
+            due = (self.wake or bool(self.cues) or bool(self.pending)
+                   or any(client.responses or sent or client.connector.cutoff
+                          for (client, _, sent) in self.hookClients))
+            if not due and self.backoff:  # earliest pending retry has come due
+                due = min(nxt for (_, nxt) in self.backoff.values()) <= self.tyme
+            if not due and (self.lastPoll is None or (self.tyme - self.lastPoll) >= self.retry):
+                # revocations wait on TEL state so poll at the retry cadence while any are escrowed
+                due = next(self.cdb.rev.getItemIter(), None) is not None
+            if not due:  # periodic sweep for timeouts and missed cues
+                due = self.lastSweep is None or (self.tyme - self.lastSweep) >= self.SweepInterval
+
+            if due:
+                self.wake = False
+                self.lastPoll = self.tyme
+                try:
+                    self.processEscrows()
+                except Exception as e:
+                    print(e)
+
+            yield min(self.retry, self.WakeTock)
+
+    def wakeup(self):
+        """ Run a full escrow pass on the next tick instead of waiting out the retry delay """
+        self.wake = True
+
+    def vcState(self, creder):
+        """ Return the TEL state for a credential, memoized for the current escrow pass
+
+        Parameters:
+            creder (Creder): credential whose registry state to look up
 
-            yield self.retry
+        """
+        key = (creder.status, creder.said)
+        state = self.states.get(key)
+        if state is None:  # each lookup walks the TEL so share one per pass
+            state = self.reger.tevers[creder.status].vcState(creder.said)
+            if state is not None:
+                self.states[key] = state
+
+        return state
 
     def processEscrows(self):
         """
         Process communication pipelines
 
         """
+        self.states.clear()
         self.processPresentations()
         self.processRevocations()
         self.processReceived(db=self.cdb.recv, action="iss")
         self.processReceived(db=self.cdb.revk, action="rev")
+
+        for resource in list(self.pending):  # flush aged partial batches
+            if (self.tyme - self.pendingSince[resource]) > self.BatchWait:
+                self.sendBatch(self.pending.pop(resource))
+                del self.pendingSince[resource]
+
         self.processAcks()
 
-    def request(self, said, resource, action, actor, data):
+    def request(self, resource, events):
         """ Generate and launch request to remote hook
 
         Parameters:
-            said (str): qb64 SAID of credential
-            data (dict): serializable body to send with call
-            action (str): the action performed on he resource [iss|rev]
-            actor (str): qualified b64 AID of sender of the event
             resource (str): the resource type that triggered the event
+            events (list): event dicts of form dict(action=, actor=, data=) to deliver
+                in one batched call
+
+        Returns:
+            Deck: in-flight FIFO of the client the request was dispatched on,
+            for tracking the batch awaiting its response
 
         """
 
-        raw = json.dumps(data).encode("utf-8")
-        print(f"Valid credential {raw}")
+        if logger.isEnabledFor(logging.DEBUG):  # skip serializing the debug copy otherwise
+            logger.debug("delivering events %s", orjson.dumps(events))
 
-        return
-        purl = parse.urlparse(self.hook)
-        client = http.clienting.Client(hostname=purl.hostname, port=purl.port)
-        clientDoer = http.clienting.ClientDoer(client=client)
-        self.extend([clientDoer])
+        if not self.hookClients:  # build pool of persistent keep-alive clients for the hook
+            for _ in range(self.PoolSize):
+                client = http.clienting.Client(hostname=self.hookHost, port=self.hookPort)
+                clientDoer = http.clienting.ClientDoer(client=client)
+                self.hookClients.append((client, clientDoer, decking.Deck()))
+                self.extend([clientDoer])
 
-        body = dict(
-            action=action,
-            actor=actor,
-            data=data
-        )
+        # round robin dispatch so slow responses on one connection do not stall the rest
+        (client, _, sent) = self.hookClients[self.hookIdx]
+        self.hookIdx = (self.hookIdx + 1) % len(self.hookClients)
 
-        raw = json.dumps(body).encode("utf-8")
-        headers = Hict([
-            ("Content-Type", "application/json"),
+        body = dict(events=events)
+
+        raw = orjson.dumps(body)
+        headers = Hict(list(self.StaticHeaders) + [
             ("Content-Length", len(raw)),
-            ("Connection", "close"),
             ("Sally-Resource", resource),
+            ("Sally-Batch-Count", len(events)),
             ("Sally-Timestamp", helping.nowIso8601()),
         ])
-        path = purl.path or "/"
+        path = self.hookPath
+
+        verfer = self.hab.kever.serder.verfers[0]
+        if verfer is not self.keyVerfer:  # keys rotated since, refresh the cached keyid
+            self.keyVerfer = verfer
+            self.keyid = encodeB64(verfer.raw).decode('utf-8')
 
-        keyid = encodeB64(self.hab.kever.serder.verfers[0].raw).decode('utf-8')
-        header, unq = httping.siginput(self.hab, "sig0", "POST", path, headers, fields=["Sally-Resource", "@method",
-                                                                                        "@path",
-                                                                                        "Sally-Timestamp"],
-                                       alg="ed25519", keyid=keyid)
+        header, unq = httping.siginput(self.hab, "sig0", "POST", path, headers, fields=self.SigFields,
+                                       alg="ed25519", keyid=self.keyid)
 
         headers.extend(header)
         signage = ending.Signage(markers=dict(sig0=unq), indexed=True, signer=self.hab.pre, ordinal=None, digest=None,
@@ -347,16 +622,16 @@ class Communicator(doing.DoDoer):
         client.request(
             method='POST',
             path=path,
-            qargs=parse.parse_qs(purl.query),
+            qargs=self.hookQArgs,
             headers=headers,
             body=raw
         )
 
-        self.clients[said] = (client, clientDoer)
+        return sent
 
     def validateIdCard(self, creder):
         card_id_said = IDCARD_SCHEMA
-        if creder.schema != card_id_said:
+        if sys.intern(creder.schema) is not card_id_said:
             raise kering.ValidationError(f'Invalid schema SAID {creder.schema} for {IDCARD_TYPE} '
                                          f'credential SAID: {card_id_said}')
         if not creder.issuer == self.auth:
@@ -387,8 +662,7 @@ class Communicator(doing.DoDoer):
 
 
     def revokePayload(self, creder):
-        regk = creder.status
-        state = self.reger.tevers[regk].vcState(creder.said)
+        state = self.vcState(creder)
 
         data = dict(
             schema=creder.schema,
@@ -67,7 +67,8 @@ def setup(hby, *, alias, httpPort, hook, auth, listen=False, timeout=10, retry=3
                                   auth=auth,
                                   hook=hook,
                                   timeout=timeout,
-                                  retry=retry)
+                                  retry=retry,
+                                  cues=verifier.cues)
 
     rvy = routing.Revery(db=hby.db)
 
@@ -82,9 +83,9 @@ def setup(hby, *, alias, httpPort, hook, auth, listen=False, timeout=10, retry=3
                  db=hby.db,
                  local=False)
     tvy.registerReplyRoutes(router=rvy.rtr)
-    tc = TeveryCuery(cdb=cdb, reger=reger, cues=tvy.cues)
+    tc = TeveryCuery(cdb=cdb, reger=reger, cues=tvy.cues, comms=comms)
 
-    handling.loadHandlers(exc=exc, cdb=cdb)
+    handling.loadHandlers(exc=exc, cdb=cdb, comms=comms)
 
     app = falcon.App(
         middleware=falcon.CORSMiddleware(
@@ -117,11 +118,12 @@ def setup(hby, *, alias, httpPort, hook, auth, listen=False, timeout=10, retry=3
 
 class TeveryCuery(doing.Doer):
 
-    def __init__(self, cdb, reger, cues=None, **kwa):
+    def __init__(self, cdb, reger, cues=None, comms=None, **kwa):
 
         self.cdb = cdb
         self.reger = reger
         self.cues = cues if cues is not None else decking.Deck()
+        self.comms = comms
 
         super(TeveryCuery, self).__init__(**kwa)
 
@@ -157,6 +159,9 @@ class TeveryCuery(doing.Doer):
                     self.cdb.snd.pin(keys=(saider.qb64,), val=prefixer)
                     self.cdb.rev.pin(keys=(saider.qb64,), val=now)
 
+                    if self.comms is not None:
+                        self.comms.wakeup()
+
                 yield self.tock
 
             yield self.tock
@@ -0,0 +1,36 @@
+# -*- encoding: utf-8 -*-
+"""
+SALLY
+sally.app.cli.commands.hook.demo module
+
+Demo hook support
+"""
+
+import falcon
+from falcon import testing
+
+from sally.app.cli.commands.hook import demo
+
+
+def test_listener_batched_events():
+    app = falcon.App()
+    app.add_route("/", demo.Listener())
+    client = testing.TestClient(app)
+
+    events = [
+        dict(action="iss",
+             actor="EOwXzTKWgsmCDVJwMS4VUJWX-m-oKx9d8VDyaRNY6mMZ",
+             data=dict(schema="EEYMNgyQNHWrsO4m65Px84M93o2url6aUpTFqNdMZdKt",
+                       credential="EL5nGzlXb8DEjFh4pOZMd7F10NYfX7inyci3iw9juY6_")),
+        dict(action="rev",
+             actor="EOwXzTKWgsmCDVJwMS4VUJWX-m-oKx9d8VDyaRNY6mMZ",
+             data=dict(schema="EEYMNgyQNHWrsO4m65Px84M93o2url6aUpTFqNdMZdKt",
+                       credential="EL5nGzlXb8DEjFh4pOZMd7F10NYfX7inyci3iw9juY6_",
+                       revocationTimestamp="2021-01-01T00:00:00.000000+00:00")),
+    ]
+
+    rep = client.simulate_post("/", json=dict(events=events))
+    assert rep.status == falcon.HTTP_200
+
+    rep = client.simulate_post("/", json=dict(events=[]))
+    assert rep.status == falcon.HTTP_200
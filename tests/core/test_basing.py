@@ -6,6 +6,7 @@ tests.db.dbing module
 import lmdb
 import os
 
+from keri.core import coring
 from keri.db import subing
 from keri.vc import proving
 from sally.core import basing
@@ -34,3 +35,38 @@ def test_baser():
     assert baser.env.stat()['entries'] == 6
 
 
+def test_write():
+    """
+    Test CueBaser.write batched operations against the normal suber API
+    """
+    baser = basing.CueBaser(name="test_write", temp=True)
+
+    pre = "ECtWlHS2Wbx5M2Rg6nm69PCtzwb1veiRNvDpBGF9Z1Pc"
+    said = "EJcjV4DalEqAtaOdlEcjNvo75HCs0lN5K3BbQwJ5kN6o"
+
+    prefixer = coring.Prefixer(qb64=pre)
+    dater = coring.Dater()
+    creder = proving.credential(schema="EEYMNgyQNHWrsO4m65Px84M93o2url6aUpTFqNdMZdKt",
+                                issuer=pre,
+                                data=dict(d="", i=pre, dt=dater.dts),
+                                status="EBmRy7xMwsxUelUauaXtMxTfPAkc6wsmU6d_51d6pGM8")
+
+    # batched pins are readable through the normal suber API
+    baser.write([(baser.snd, (said,), prefixer),
+                 (baser.iss, (said,), dater),
+                 (baser.ack, (said,), creder)])
+
+    assert baser.snd.get(keys=(said,)).qb64 == pre
+    assert baser.iss.get(keys=(said,)).qb64 == dater.qb64
+    assert baser.ack.get(keys=(said,)).raw == creder.raw
+
+    # a batched pin overwrites what pin wrote and a None val deletes it
+    other = coring.Dater()
+    baser.iss.pin(keys=(said,), val=dater)
+    baser.write([(baser.iss, (said,), other),
+                 (baser.snd, (said,), None),
+                 (baser.ack, (said,), None)])
+
+    assert baser.iss.get(keys=(said,)).qb64 == other.qb64
+    assert baser.snd.get(keys=(said,)) is None
+    assert baser.ack.get(keys=(said,)) is None